@@ -1,7 +1,7 @@
 from collections import defaultdict, namedtuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from functools import cache, cached_property
+from functools import cache, cached_property, lru_cache
 from operator import itemgetter
 import re
 import bisect
@@ -17,50 +17,65 @@ def generate_puzzle_id() -> str:
     seconds_since_midnight = int((now - midnight).total_seconds())
     return f"{now.year:04d}{now.month:02d}{now.day:02d}{seconds_since_midnight:05d}"
 
+LETTER_RE = re.compile(r'\w')
+
+@lru_cache(maxsize=8192)
 def count_letters(s: str) -> int:
     """Count letters in s, return (nb_chars, firstchar_pos, lastchar_pos)
     string s is expected to contain letters and self.empty_marker (MUST NOT match regex \w)
     as fillable markers.
     """
-    letters_pos = [(m.span()[0]) for m in re.finditer(r'\w', s)]
+    letters_pos = [m.start() for m in LETTER_RE.finditer(s)]
     if len(letters_pos) == 0:
         raise ValueError(f"No letter(s) in string={s}")
     
     return (len(letters_pos), letters_pos[0], letters_pos[-1])
 
+# regex fragments shared by all get_regex patterns
+LEFT_PFIX = r'\[(\d+)\]('
+RIGHT_PFIX = r')\[(\d+)\]'
+
+@cache
+def exact_gap(n: int) -> str:
+    return r'\w{' + str(n) + '}'
+
+@cache
+def upto_gap(n: int) -> str:
+    return r'\w{0,' + str(n) + '}'
+
+@lru_cache(maxsize=8192)
 def get_regex(letter_seq: str, empty_marker) -> str:
-    """ Generate regex pattern string for a given letter sequence.
+    """ Generate regex pattern string for a given letter sequence (memoized,
+    the same sequences reappear across lines and fillout iterations).
     Args:
         letter_seq: String of letters, e.g. '--R----G--E' (if empty_marker='-')
     Returns:
         Regex pattern string, e.g. r'\[(\d+)\](\w{0,2}R\w{4}G\w{2}E)\[(\d+)\]'
     """
-    pfix = r'\[(\d+)\]'
     nb_c, firstc_pos, lastc_pos = count_letters(letter_seq)
 
+    result_list = [LEFT_PFIX]
     if firstc_pos > 0:
-        left_opt_c = r'(\w{0,' + str(firstc_pos) + '}'
-        result_list = [pfix, left_opt_c, ]
-    else:
-        result_list = [pfix, '(', ]
+        result_list.append(upto_gap(firstc_pos))
 
-    counter_empty = 0
-    for i in range(firstc_pos, lastc_pos + 1):
-        if letter_seq[i] == empty_marker:
-            counter_empty += 1
-        else:
-            if counter_empty > 0:
-                result_list.append(r'\w{' + str(counter_empty) + '}')
-            result_list.append(letter_seq[i])
-            counter_empty = 0
+    # single letter (common on sparse grid): no gap to encode
+    if nb_c == 1:
+        result_list.append(letter_seq[firstc_pos])
+    else:
+        counter_empty = 0
+        for i in range(firstc_pos, lastc_pos + 1):
+            if letter_seq[i] == empty_marker:
+                counter_empty += 1
+            else:
+                if counter_empty > 0:
+                    result_list.append(exact_gap(counter_empty))
+                result_list.append(letter_seq[i])
+                counter_empty = 0
 
     if lastc_pos < len(letter_seq) - 1:
-        right_opt_c = r'\w{0,' + str(len(letter_seq)-1-lastc_pos) + '})'
-        result_list.append(right_opt_c)
-    else:
-        result_list.append(')')
-    result = ''.join(result_list) + pfix
-    return result
+        result_list.append(upto_gap(len(letter_seq) - 1 - lastc_pos))
+    result_list.append(RIGHT_PFIX)
+    return ''.join(result_list)
 
 def generate_patterns(letter_seq: str, pos, min_size, empty_marker='-'): 
     """Generate all regex subpatterns from letter_seq 
@@ -70,8 +85,17 @@ def generate_patterns(letter_seq: str, pos, min_size, empty_marker='-'):
         letter_seq: letters pattern, e.g. '--R----G--E'
         pos: Position index in grid where letter_seq starts (row or col)
         
-    Yields: Tuples of (pattern_regex, pos)
+    Yields: Distinct tuples of (pattern_regex, pos), in a deterministic order
     """
+    yield from _trimmed_patterns(letter_seq, pos, min_size, empty_marker, set())
+
+def _trimmed_patterns(letter_seq: str, pos, min_size, empty_marker, seen: set):
+    # same sub-sequence is reached by trimming "right" then "left" and "left" then "right", 
+    # explore it only once
+    if (letter_seq, pos) in seen:
+        return
+    seen.add((letter_seq, pos))
+
     nb_chars, first_char_pos, last_char_pos = count_letters(letter_seq)
     if len(letter_seq) < min_size:
         return
@@ -83,12 +107,49 @@ def generate_patterns(letter_seq: str, pos, min_size, empty_marker='-'):
         # trim "right":
         sub_seq = letter_seq[:last_char_pos-1]
         if len(sub_seq) > 1:
-            yield from generate_patterns(sub_seq, pos, min_size)
+            yield from _trimmed_patterns(sub_seq, pos, min_size, empty_marker, seen)
         # trim "left"
         new_pos = pos + first_char_pos + 2
         sub_seq = letter_seq[first_char_pos+2:]
         if len(sub_seq) > 1:
-            yield from generate_patterns(sub_seq, new_pos, min_size)
+            yield from _trimmed_patterns(sub_seq, new_pos, min_size, empty_marker, seen)
+
+@lru_cache(maxsize=4096)
+def fitting_windows(letter_seq: str, min_size, empty_marker='-') -> tuple[tuple[int, tuple], ...]:
+    """Windows of letter_seq where a word could fit (same words as the ones matched by
+    generate_patterns regexes): holding 1 or more letters and not touching a letter outside it.
+    
+    Returns: Tuples of (size, letters) for each window, letters being (letter, offset, size) 
+    of the letters inside the window.
+    """
+    n = len(letter_seq)
+    letters_pos = [i for i, c in enumerate(letter_seq) if c != empty_marker]
+    windows = []
+    for start in range(n):
+        if start > 0 and letter_seq[start-1] != empty_marker:
+            continue
+        for end in range(start + min_size - 1, n):
+            if end < n - 1 and letter_seq[end+1] != empty_marker:
+                continue
+            size = end - start + 1
+            letters = tuple((letter_seq[p], p - start, size) for p in letters_pos if start <= p <= end)
+            if letters:
+                windows.append((size, letters))
+    return tuple(windows)
+
+@lru_cache(maxsize=65536)
+def split_subpatterns(line: str, filled_marker, min_size) -> tuple[tuple[str, int], ...]:
+    """Split row/col text pattern on filled markers into (sub-pattern, position) of size larger
+    or equal to min_size, sorted from largest to smallest in length (memoized, the same line 
+    texts recur across locations and fillout iterations).
+    """
+    letter_sequences : list[tuple[str,int]] = []
+    start = 0
+    for s in line.split(filled_marker):
+        if len(s) >= min_size:
+            letter_sequences.append((s,start))
+        start += len(s) + 1
+    return tuple(sorted(letter_sequences, key=lambda x: len(x[0]), reverse=True))
 
 
 # -----------------------
@@ -102,13 +163,20 @@ class StopCondition(enum.Enum):
         COMPLETED = -2
         # No more words to select from
         NO_MORE_WORDS = -3
+        # Fillout ran out of time
+        TIMEOUT = -4
 
 class Location(NamedTuple):
     direction : int
     index : int
 
 
-@dataclass(order=True)
+def canonicalize(word: str) -> str:
+    """Return word as appearing in Grid."""
+    # TODO: dev funt to remove accent
+    return word.upper()
+
+@dataclass(order=True, slots=True)
 class Word:
     word: str
     # as appear in grid (capital, non-accented, etc..)
@@ -119,11 +187,15 @@ class Word:
     col: int = field(default=None, compare=False)
     # 0=across, 1=down
     direction: int = field(default=None, compare=False)
+    # derived from canonical (slots require declaring it upfront)
+    size: int = field(default=None, init=False, compare=False)
+    # (row, col) -> letter, filled once positioned
+    cells: dict[tuple[int,int], str] = field(default=None, init=False, compare=False, repr=False)
+    # (span, padded span), filled once positioned
+    spans: tuple[list[int], list[int]] = field(default=None, init=False, compare=False, repr=False)
 
     def __post_init__(self):
-        # TODO: dev funt to remove accent and capitalize
-        # as appearing in Grid
-        self.canonical = self.word.upper()
+        self.canonical = canonicalize(self.word)
         self.size = len(self.canonical)
     
     def set_position(self, location: Location, pos: int):
@@ -134,12 +206,22 @@ class Word:
         else:
             self.row = location.index
             self.col = pos
+        if self.direction == 0:
+            self.cells = {(self.row, self.col + i): l for i, l in enumerate(self.canonical)}
+        else:
+            self.cells = {(self.row + i, self.col): l for i, l in enumerate(self.canonical)}
+        self.spans = (self._compute_span(padding=False), self._compute_span(padding=True))
     
-    # @cache TODO: test fail when using cache decorator
     def span(self, padding=False) -> list[int]:
         """Return blocked span of this word as list[start-index, end-index] both inclusive. 
         Use padding=True to include one cell before and after the word itself.
+        (precomputed once positioned, returned list must not be modified)
         """
+        if self.spans:
+            return self.spans[padding]
+        return self._compute_span(padding)
+
+    def _compute_span(self, padding) -> list[int]:
         if self.direction == 0:
             start = self.col - (1 if padding and self.col > 0 else 0)
             end = self.col + self.size - 1 + (1 if padding else 0)
@@ -152,12 +234,8 @@ class Word:
     def letter_at(self, cell_row: int, cell_col: int) -> str:
         """Return letter at given cell (row, col) if part of this word, else None.
         """
-        if self.direction == 0:  # across
-            if cell_row == self.row and self.col <= cell_col < self.col + self.size:
-                return self.canonical[cell_col - self.col]
-        elif self.direction == 1:  # down
-            if cell_col == self.col and self.row <= cell_row < self.row + self.size:
-                return self.canonical[cell_row - self.row]
+        if self.cells:
+            return self.cells.get((cell_row, cell_col))
 
 
 class Puzzle:
@@ -170,17 +248,37 @@ class Puzzle:
         """
         self.id: str = generate_puzzle_id()
         self.grid_size = grid_size      
-        self.available_words: list[Word] = []
-        self.min_size_word = self.grid_size
-        for i, w in enumerate(words):
-            if len(w[0]) < self.min_size_word:
-                self.min_size_word = len(w[0])
-            if len(w[0]) <= self.grid_size:
-                self.available_words.append(Word(word=w[0], clue=w[1]))
-        self.available_words.sort(key=lambda x: len(x.word), reverse=True)
-
-        # '[3]WORDX[7]WORDY...'
-        self.available_wordseq = ''.join([f"[{i}]{w.canonical}" for i, w in enumerate(self.available_words)])
+        # words fitting in grid bucketed by size (in input order)
+        self.words_by_size: dict[int, list[Word]] = defaultdict(list)
+        min_size = grid_size
+        for word, clue in words:
+            size = len(word)
+            if size > grid_size:
+                continue
+            if size < min_size:
+                min_size = size
+            self.words_by_size[size].append(Word(word=word, clue=clue))
+        self.min_size_word = min_size
+        # longest first
+        self.available_words: list[Word] = [w for size in sorted(self.words_by_size, reverse=True) for w in self.words_by_size[size]]
+
+        # canonical -> index in available_words (first one when several words share a canonical form)
+        self._word_index: dict[str, int] = {}
+        for i, w in enumerate(self.available_words):
+            self._word_index.setdefault(w.canonical, i)
+        # bitsets over available_words indexes (bit i <-> word i): words of a given size, and words
+        # of a given size having letter at offset, (letter, offset, size) -> bits
+        self.size_bits: dict[int, int] = defaultdict(int)
+        self.letter_bits: dict[tuple[str, int, int], int] = defaultdict(int)
+        for i, w in enumerate(self.available_words):
+            bit = 1 << i
+            self.size_bits[w.size] |= bit
+            for offset, letter in enumerate(w.canonical):
+                self.letter_bits[(letter, offset, w.size)] |= bit
+        # words not yet placed (placing a word only clears its bit)
+        self.available_bits = (1 << len(self.available_words)) - 1
+        # find_matches results per letter sequence, valid until next placement
+        self._matches: dict[str, Optional[tuple[int, str]]] = {}
         self.placed_words: dict[Location, list[Word]] = {}
         self.nb_placed_words = 0
         
@@ -189,61 +287,91 @@ class Puzzle:
         
         # convenient structures
         self.grid = [[self.empty_marker for _ in range(self.grid_size)] for _ in range(self.grid_size)]
+        # (row, col) -> letter of all placed words
+        self.letter_at_cell: dict[tuple[int,int], str] = {}
+        # entire text pattern per row/col, dropped when a word placement affects it
+        self._cached_lines: dict[Location, str] = {}
         # No word can fit these row/col Adresses  (no space left)
         self.complete_locations: set[Location] = set() 
         # No Word and letter present on these row/col Adresses to attach word
         self.empty_locations: set[Location] = { Location(direction=d, index=i) for d in [0,1] for i in range(self.grid_size)} 
         # all possibles locations
         self.all_locations: set[Location] = { Location(direction=d, index=i) for d in [0,1] for i in range(self.grid_size)}
+        # locations neither empty nor complete (candidates for next selection), with their index in list
+        self.available_locations: list[Location] = []
+        self._available_index: dict[Location, int] = {}
     
+    def index_of(self, word: str) -> int:
+        """Return index of word (matched on its canonical form) in available_words (placed or not), 
+        raise KeyError if not found.
+        """
+        return self._word_index[canonicalize(word)]
+
+    @property
+    def available_wordseq(self) -> str:
+        """Words not yet placed as '[3]WORDX[7]WORDY...' (built on demand, not kept up to date 
+        on each placement)
+        """
+        return ''.join([f"[{i}]{w.canonical}" for i, w in enumerate(self.available_words) 
+                        if self.available_bits >> i & 1])
+
     def _entire_textpattern(self, loc: Location) -> str:
         """Derive text pattern for the entire row/col (loc), with empty markers, 
         filled markers and letter from perpendicular placed words.
         """
+        line = self._cached_lines.get(loc)
+        if line is not None:
+            return line
+
         if loc.direction == 0:
-            pattern = [self.grid[loc.index][c] for c in range(self.grid_size)]
+            pattern = list(self.grid[loc.index])
         else:
             pattern = [self.grid[r][loc.index] for r in range(self.grid_size)]
 
         # blocking cells from words placed on same col/row
-        block_cells = [ cells for w in self.placed_words.get(loc, []) for cells in w.span(padding=True)]
+        block_cells = { cell for w in self.placed_words.get(loc, []) for cell in w.span(padding=True)}
         
-        # blocking cells from words on "left" col/row 
-        left_cells = []
+        # blocking cells from words on "left" and "right" col/row 
+        side_cells = set()
         if loc.index > 0:
             left_adress = Location(loc.direction, loc.index - 1)
-            left_cells = [ cells for w in self.placed_words.get(left_adress, []) for cells in w.span()]
-
-        # blocking cells from words on "right" col/row'
-        right_cells = []
+            side_cells.update(cell for w in self.placed_words.get(left_adress, []) for cell in w.span())
         if loc.index < self.grid_size - 1:
             right_adress = Location(loc.direction, loc.index + 1)
-            right_cells = [ cells for w in self.placed_words.get(right_adress, []) for cells in w.span() ]
+            side_cells.update(cell for w in self.placed_words.get(right_adress, []) for cell in w.span())
+
+        # perpendicular words on "left" (at least a 2-letter word) and "right" neighbor cells
+        check_left = loc.index >= 2
+        check_right = loc.index <= self.grid_size - 3
+        letters = self.letter_at_cell
 
         # go over each cell and mark blocked ones
         for cell_i in range(self.grid_size):
             if cell_i in block_cells:
                 pattern[cell_i] = self.filled_marker
             elif pattern[cell_i] == self.empty_marker:
-                # left/right spans block empty cells
-                if cell_i in left_cells or cell_i in right_cells:
-                    pattern[cell_i] = self.filled_marker
-                # also block by a word placed perpendicularly ending/starting on neighbor cell 
                 if loc.direction == 1:
-                    # "left" (at least a 2-letter word)
-                    if loc.index >= 2 and self.grid[cell_i][loc.index-1] != self.empty_marker: 
-                        pattern[cell_i] = self.filled_marker
-                    # "right"
-                    elif loc.index <= self.grid_size - 3 and self.grid[cell_i][loc.index+1] != self.empty_marker:
-                        pattern[cell_i] = self.filled_marker
-                else:  # direction == 0
-                    # "left"
-                    if loc.index >= 2 and self.grid[loc.index-1][cell_i] != self.empty_marker: 
-                        pattern[cell_i] = self.filled_marker
-                    # "right"
-                    elif loc.index <= self.grid_size - 3 and self.grid[loc.index+1][cell_i] != self.empty_marker:
-                        pattern[cell_i] = self.filled_marker
-        return ''.join(pattern)
+                    left, right = (cell_i, loc.index-1), (cell_i, loc.index+1)
+                else:
+                    left, right = (loc.index-1, cell_i), (loc.index+1, cell_i)
+                # left/right spans block empty cells, so does a word placed perpendicularly
+                # ending/starting on neighbor cell
+                if (cell_i in side_cells
+                        or (check_left and left in letters)
+                        or (check_right and right in letters)):
+                    pattern[cell_i] = self.filled_marker
+        line = ''.join(pattern)
+        self._cached_lines[loc] = line
+        return line
+
+    def _invalidate_lines(self, word: Word, loc: Location):
+        """Drop cached text patterns of all row/col affected by word placed at loc: 
+        same row/col and its neighbors, plus perpendicular ones spanned by the word (padded).
+        """
+        for i in (loc.index - 1, loc.index, loc.index + 1):
+            self._cached_lines.pop(Location(loc.direction, i), None)
+        for i in word.span(padding=True):
+            self._cached_lines.pop(Location(1 - loc.direction, i), None)
 
 
     def _get_all_subpatterns(self, loc: Location, min_size_word) -> list[tuple[str,int]]:
@@ -251,23 +379,22 @@ class Puzzle:
         """
         
         entirepattern = self._entire_textpattern(loc)
+        # no blocked cell (common on sparse grid): whole line is the only sub-pattern
+        if self.filled_marker not in entirepattern:
+            return [(entirepattern, 0)] if len(entirepattern) >= min_size_word else []
 
-        letter_sequences : list[tuple[str,int]] = []
-        # Add consecutive subpatterns of minimum size 2
-        for s in entirepattern.split(self.filled_marker):
-            if len(s) >= min_size_word:
-                letter_sequences.append((s,entirepattern.index(s)))
-        
-        # return tuple of (sub-pattern, position) sorted from largest to smallest in length
-        return sorted(letter_sequences, key=lambda x: len(x[0]), reverse=True)
+        return list(split_subpatterns(entirepattern, self.filled_marker, min_size_word))
 
 
     def fillout(self, timeout: int = 60):
         """Fillout all Grid iteratively byy trying to place none empty or filled row or col randomly
         
         ..to be experimented!
+
+        Returns the StopCondition ending it (TIMEOUT when not done within timeout seconds).
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
         iter, iter_skip = 0, 0
         self.place_first_word()
         
@@ -276,11 +403,13 @@ class Puzzle:
         while True:
             iter += 1
             selection = self.next_selection(currently_blocked)
+            if time.monotonic() >= deadline:
+                selection = StopCondition.TIMEOUT
 
             if type(selection) == StopCondition:
-                self.elapse_time = time.time()-start_time
+                self.elapse_time = time.monotonic()-start_time
                 print(f"Fillout completed in {self.elapse_time:.2f} sec! #iterations={iter} (#skips={iter_skip})! --> {selection}")
-                break
+                return selection
             
             letter_seqs = self._get_all_subpatterns(selection, self.min_size_word)
             assert len(letter_seqs) > 0
@@ -328,22 +457,33 @@ class Puzzle:
         if self.nb_placed_words == len(self.available_words):
             return StopCondition.NO_MORE_WORDS
 
-        available_locations = self.all_locations.difference(self.complete_locations, self.empty_locations)
-        
-        if len(available_locations) == 0:
+        if len(self.available_locations) == 0:
             return StopCondition.COMPLETED
         
-        if available_locations == currently_blocked:
+        if currently_blocked.issuperset(self.available_locations):
             return StopCondition.ALL_BLOCKED
         
-        return random.choice(available_locations)
+        return self.available_locations[random.randrange(len(self.available_locations))]
+
+    def _add_available(self, loc: Location):
+        if loc not in self._available_index:
+            self._available_index[loc] = len(self.available_locations)
+            self.available_locations.append(loc)
+
+    def _remove_available(self, loc: Location):
+        # swap with last to remove in O(1)
+        i = self._available_index.pop(loc, None)
+        if i is not None:
+            last = self.available_locations.pop()
+            if i < len(self.available_locations):
+                self.available_locations[i] = last
+                self._available_index[last] = i
 
     def _is_location_blocked(self, subpatterns: list[tuple[str,int]]):
-        for p in subpatterns:
-            assert p.count(self.filled_marker) == 0
-            if p.count(self.empty_marker) < len(p):
-                return False
-        return True
+        """Return True when none of the subpatterns holds a letter to attach a word to.
+        """
+        # subpatterns have no filled marker, so stripping empty ones leaves only letters
+        return not any(p.strip(self.empty_marker) for p, _ in subpatterns)
 
     def _is_location_complete(self, loc: Location):
         subpatterns = self._get_all_subpatterns(loc, self.min_size_word)
@@ -352,18 +492,35 @@ class Puzzle:
     def find_matches(self, letter_seq: str) -> Optional[tuple[int, str]]:
         """Find and return first word fitting the row/col letter_seq
 
+        Candidates of each window (see fitting_windows) are found by AND-ing the bitsets 
+        of its letters.
+
         Args: 
             letter_seq: Letter sequence to match for some row/col in grid'
         
         Returns:
             Tuples of (word_n, matched_word) where word_n is sequence# in available_words.
         """
-        for p_regex in self.gen_patterns(letter_seq):
-            match = re.search(p_regex, self.available_wordseq)
-            if match:
-                word_n = int(match.group(1))
-                matched_word = match.group(2)
-                return word_n, matched_word
+        # same line texts get probed again and again between two placements
+        if letter_seq in self._matches:
+            return self._matches[letter_seq]
+
+        size_bits, letter_bits = self.size_bits, self.letter_bits
+        matched = 0
+        for size, letters in fitting_windows(letter_seq, self.min_size_word, self.empty_marker):
+            bits = size_bits.get(size, 0) & self.available_bits
+            for letter in letters:
+                if not bits:
+                    break
+                bits &= letter_bits.get(letter, 0)
+            matched |= bits
+        result = None
+        if matched:
+            # lowest bit, i.e. first in available_words (longest first)
+            word_n = (matched & -matched).bit_length() - 1
+            result = word_n, self.available_words[word_n].canonical
+        self._matches[letter_seq] = result
+        return result
 
     def place_first_word(self, word_index: int = None, loc: Location = None, pos: int = None):
         """"Place first word (at index word_i in avalable_words) at adress and pos, when not provided 
@@ -407,30 +564,26 @@ class Puzzle:
                 self.grid[loc.index][pos + i] = word.canonical[i]
             else:
                 self.grid[pos+i][loc.index] = word.canonical[i]
+        self.letter_at_cell.update(word.cells)
+        self._invalidate_lines(word, loc)
 
-        # available_wordseq 
-        s_index = self.available_wordseq.index(f'[{word_index}]')
-        e_index = self.available_wordseq.find('[', s_index+1)
-        if e_index == -1:
-            e_index = len(self.available_wordseq)
-        self.available_wordseq = self.available_wordseq[:s_index] + self.available_wordseq[e_index:]
+        self.available_bits &= ~(1 << word_index)
+        self._matches.clear()
                 
         # self.empty_indexes 
-        self.empty_locations.difference_update({Location(direction=1-loc.direction, index=i) for i in word.span()})
+        no_longer_empty = self.empty_locations.intersection({Location(direction=1-loc.direction, index=i) for i in word.span()})
+        self.empty_locations.difference_update(no_longer_empty)
+        for l in no_longer_empty:
+            if l not in self.complete_locations:
+                self._add_available(l)
         
-        # self.complete_indexes on current index
-        if self._is_location_complete(loc):
-            self.complete_locations.add(loc)
-        # on "left index"
-        if loc.index > 0:
-            left_loc = Location(loc.direction, index=loc.index-1)
-            if self._is_location_complete(left_loc):
-                self.complete_locations.add(left_loc)
-        # on "right index"
-        if loc.index < self.grid_size - 1:
-            right_loc = Location(loc.direction, index=loc.index+1)
-            if self._is_location_complete(right_loc):
-                self.complete_locations.add(right_loc)
+        # self.complete_indexes on current, "left" and "right" index
+        for i in (loc.index - 1, loc.index, loc.index + 1):
+            if 0 <= i < self.grid_size:
+                l = Location(loc.direction, index=i)
+                if self._is_location_complete(l):
+                    self.complete_locations.add(l)
+                    self._remove_available(l)
 
     
     def stats_info(self):
@@ -439,13 +592,16 @@ class Puzzle:
     def __str__(self):
         return '\n'.join([' '.join(row) for row in self.grid])
 
-#     def to_dict(self):
-#         return {
-#             "id": self.id,
-#             "rows": self.rows,
-#             "cols": self.cols,
-#             "words": [w.__dict__ for w in self.words]
-#         }
+    def to_dict(self):
+        """Return placed words and puzzle info as plain dict (init fields of Word only, 
+        as Word has no __dict__ and derived attributes are rebuilt on creation).
+        """
+        return {
+            "id": self.id,
+            "grid_size": self.grid_size,
+            "words": [{f.name: getattr(w, f.name) for f in fields(w) if f.init}
+                      for words in self.placed_words.values() for w in words]
+        }
 
 #     @staticmethod
 #     def from_dict(data):
@@ -1,3 +1,6 @@
+from collections import deque
+import time
+
 from kivy.app import App
 from kivy.uix.floatlayout import FloatLayout
 from kivy.uix.boxlayout import BoxLayout
@@ -5,13 +8,17 @@ from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.textinput import TextInput
-from kivy.graphics import Color, Line
+from kivy.graphics import Color, InstructionGroup, Line, Rectangle
+from kivy.core.text import Label as CoreLabel
 from kivy.core.window import Window
 from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.utils import get_color_from_hex
-from functools import partial
+from kivy.properties import StringProperty
 
 from domain import (
     PuzzleSpec,
@@ -30,13 +37,36 @@ FONT_LARGE = dp(22)
 FONT_MEDIUM = dp(16)
 FONT_SMALL = dp(12)
 
-WHITE = get_color_from_hex("#FFFFFF")
-DARK = get_color_from_hex("#2C3E50")
-ACCENT = get_color_from_hex("#3498DB")
-GOOD = get_color_from_hex("#2ECC71")
-BAD = get_color_from_hex("#E74C3C")
-PANEL = get_color_from_hex("#ECF0F1")
-SUBTLE = get_color_from_hex("#7F8C8D")
+# derived sizes, computed once
+CELL_STEP = CELL_SIZE + CELL_SPACING
+TITLE_H = FONT_LARGE * 1.3
+CLUE_H = FONT_LARGE * 1.2
+PAD2 = CELL_SPACING * 2
+PAD3 = CELL_SPACING * 3
+PAD5 = CELL_SPACING * 5
+
+WHITE = tuple(get_color_from_hex("#FFFFFF"))
+DARK = tuple(get_color_from_hex("#2C3E50"))
+ACCENT = tuple(get_color_from_hex("#3498DB"))
+GOOD = tuple(get_color_from_hex("#2ECC71"))
+BAD = tuple(get_color_from_hex("#E74C3C"))
+PANEL = tuple(get_color_from_hex("#ECF0F1"))
+SUBTLE = tuple(get_color_from_hex("#7F8C8D"))
+
+# (row, col) step of each arrow key
+ARROW_DELTAS = {'right': (0, 1), 'left': (0, -1), 'down': (1, 0), 'up': (-1, 0)}
+
+# clue number textures shared by all cells (rendered white, tinted when drawn)
+_number_textures = {}
+
+
+def get_number_texture(number):
+    texture = _number_textures.get(number)
+    if texture is None:
+        core_label = CoreLabel(text=str(number), font_size=FONT_SMALL)
+        core_label.refresh()
+        texture = _number_textures[number] = core_label.texture
+    return texture
 
 
 class CrosswordCell(TextInput):
@@ -49,6 +79,10 @@ class CrosswordCell(TextInput):
         self.is_frozen = False
         self.word_ids = []  # Which word(s) this cell belongs to
         self.clue_number = None
+        self.border_line = None  # Border and number are drawn by the grid
+        self.number_rect = None
+        self.is_filled = False  # As last seen by the grid
+        self.key_handler = None  # Shared controller callback: (cell, keycode, text)
 
         self.multiline = False
         self.write_tab = False
@@ -63,25 +97,51 @@ class CrosswordCell(TextInput):
         self.halign = 'center'
         self.padding = [0, CELL_SIZE * 0.2, 0, 0]
 
-        with self.canvas.before:
-            Color(*DARK)
-            self.border_line = Line(rectangle=(self.x, self.y, self.width, self.height), width=1.5)
+        self._last_rect = None
 
         self.bind(pos=self.update_border, size=self.update_border)
         self.bind(text=self.on_text_change)
         self.bind(focus=self.on_focus_change)
 
     def update_border(self, *args):
-        self.border_line.rectangle = (self.x, self.y, self.width, self.height)
+        rect = (self.x, self.y, self.width, self.height)
+        if rect == self._last_rect:
+            return
+        self._last_rect = rect
+        if self.border_line:
+            self.border_line.rectangle = rect
+        if self.number_rect:
+            self.number_rect.pos = self._number_pos()
+
+    def _number_pos(self):
+        return (self.x + 2, self.top - self.number_rect.size[1])
+
+    def make_border(self):
+        """Create the border line, to be drawn by the grid"""
+        self._last_rect = (self.x, self.y, self.width, self.height)
+        self.border_line = Line(rectangle=self._last_rect, width=1.5)
+        return self.border_line
+
+    def set_clue_number(self, number):
+        """Create clue number rectangle (top-left corner), to be drawn by the grid over the cell content"""
+        self.clue_number = number
+        texture = get_number_texture(number)
+        self.number_rect = Rectangle(texture=texture, size=texture.size)
+        self.number_rect.pos = self._number_pos()
+        return self.number_rect
+
+    def keyboard_on_key_down(self, window, keycode, text, modifiers):
+        if self.key_handler:
+            return self.key_handler(self, keycode, text)
+        return super().keyboard_on_key_down(window, keycode, text, modifiers)
 
     def on_text_change(self, instance, value):
         if self.is_frozen:
             return
-        # Only allow single uppercase letter
-        if len(value) > 1:
-            self.text = value[-1].upper()
-        elif len(value) == 1:
-            self.text = value.upper()
+        # Only allow single uppercase letter (last one typed)
+        letter = value[-1:].upper()
+        if letter != value:
+            self.text = letter
         # Navigation is handled by the controller, not here
 
     def on_focus_change(self, instance, value):
@@ -117,118 +177,235 @@ class CrosswordGrid(FloatLayout):
         self.cells = {}
         self.words_completed = set()
         self.on_word_complete = None
+        # (deadline, cells) of incorrect words waiting to be cleared, oldest first
+        # (drained by one shared scheduled call)
+        self._pending_reset = deque()
+        self._reset_scheduled = False
+        # full words to check, coalesced into one check per frame
+        self._dirty_words = set()
+        self._check_scheduled = False
 
         if not puzzle or not puzzle.words:
             return
 
-        occupied = set()
-        start_positions = {}
-
-        max_row = max((ws.position[0] for ws in puzzle.words), default=1)
-        max_col = max((ws.position[1] for ws in puzzle.words), default=1)
+        self.grid_container = FloatLayout(size_hint=(None, None))
 
+        # (row, col) of each word's cells, aligned with puzzle.words,
+        # grid extent is taken from the words' last cells in the same pass
+        self.word_positions = []
+        max_row = max_col = 1
         for ws in puzzle.words:
-            start_positions[(ws.position[0], ws.position[1])] = ws.number
-            word = ws.word
-            direction = ws.direction
             row, col = ws.position
-            for i in range(len(word)):
-                if direction == 'across':
-                    occupied.add((row, col + i))
-                else:
-                    occupied.add((row + i, col))
-
-        self.grid_container = FloatLayout(size_hint=(None, None))
-
+            if ws.direction == 'across':
+                positions = [(row, col + i) for i in range(len(ws.word))]
+            else:
+                positions = [(row + i, col) for i in range(len(ws.word))]
+            self.word_positions.append(positions)
+            last_row, last_col = positions[-1]
+            if last_row > max_row:
+                max_row = last_row
+            if last_col > max_col:
+                max_col = last_col
+
+        self.max_row, self.max_col = max_row, max_col
+        # dense cell lookup by [row][col] (None where no cell), self.cells is kept for iteration
+        self.cells_grid = [[None] * (max_col + 1) for _ in range(max_row + 1)]
+
+        base_y = max_row * CELL_STEP
         for word_idx, ws in enumerate(puzzle.words):
-            word = ws.word
-            direction = ws.direction
-            row, col = ws.position
-            for i in range(len(word)):
-                r, c = (row, col + i) if direction == 'across' else (row + i, col)
-                if (r, c) not in self.cells:
+            for i, (r, c) in enumerate(self.word_positions[word_idx]):
+                cell = self.cells_grid[r][c]
+                if cell is None:
                     cell = CrosswordCell(r, c)
-                    cell.pos = (
-                        (c - 1) * (CELL_SIZE + CELL_SPACING),
-                        (max_row - r) * (CELL_SIZE + CELL_SPACING)
-                    )
-                    self.cells[(r, c)] = cell
-                    self.grid_container.add_widget(cell)
-                    if (r, c) in start_positions:
-                        cell.clue_number = start_positions[(r, c)]
-                        number_label = Label(
-                            text=str(start_positions[(r, c)]),
-                            font_size=FONT_SMALL,
-                            color=SUBTLE,
-                            size_hint=(None, None),
-                            size=(FONT_LARGE * 0.7, FONT_LARGE * 0.7),
-                            pos=(cell.x + 2, cell.y + cell.height - FONT_LARGE * 0.7)
-                        )
-                        # Use partial to avoid late binding
-                        cell.bind(pos=partial(self._update_number_label_pos, number_label))
-                        self.grid_container.add_widget(number_label)
-                self.cells[(r, c)].word_ids.append(word_idx)
-
-        grid_width = (max_col) * (CELL_SIZE + CELL_SPACING)
-        grid_height = (max_row) * (CELL_SIZE + CELL_SPACING)
+                    cell.pos = ((c - 1) * CELL_STEP, base_y - r * CELL_STEP)
+                    self.cells_grid[r][c] = self.cells[(r, c)] = cell
+                # clue number only shows on the word's first cell (which may have been created by a crossing word)
+                if i == 0 and cell.clue_number is None:
+                    cell.set_clue_number(ws.number)
+                cell.word_ids.append(word_idx)
+
+        # borders and clue numbers of all cells drawn from one group, over the cells
+        self.border_group = InstructionGroup()
+        self.border_group.add(Color(*DARK))
+        # widgets are built first (above) and added in one pass
+        for cell in self.cells.values():
+            self.grid_container.add_widget(cell)
+            self.border_group.add(cell.make_border())
+        self.border_group.add(Color(*SUBTLE))
+        for cell in self.cells.values():
+            if cell.number_rect:
+                self.border_group.add(cell.number_rect)
+        self.grid_container.canvas.after.add(self.border_group)
+
+        grid_width = max_col * CELL_STEP
+        grid_height = base_y
         self.grid_container.size = (grid_width, grid_height)
 
         scroll = ScrollView(do_scroll_x=True, do_scroll_y=True)
         scroll.add_widget(self.grid_container)
         self.add_widget(scroll)
 
-        Clock.schedule_once(self.center_grid, 0.1)
-
-        # Safe binding for word completion check
-        for cell in self.cells.values():
-            cell.bind(text=partial(self._on_cell_text_change))
+        # center as soon as (and whenever) grid gets its size
+        self.bind(size=self.center_grid)
 
-    def _update_number_label_pos(self, number_label, cell, pos):
-        number_label.pos = (cell.x + 2, cell.y + cell.height - FONT_LARGE * 0.7)
+        # cells of each word (same order as puzzle.words) and expected words
+        self.word_cells = [tuple(self.cells_grid[r][c] for r, c in positions) for positions in self.word_positions]
+        self.word_chars = [tuple(ws.word) for ws in puzzle.words]
+        # nb of filled cells per word, a word is checked only once all are filled
+        self.filled_count = [0] * len(puzzle.words)
+        self.word_lengths = [len(cells) for cells in self.word_cells]
 
-    def _on_cell_text_change(self, *args, **kwargs):
-        self.check_word_completion()
+        # per word, links to next/previous non-frozen cell (frozen cells get skipped over)
+        self.next_cells = [dict(zip(cells, cells[1:])) for cells in self.word_cells]
+        self.prev_cells = [dict(zip(cells[1:], cells)) for cells in self.word_cells]
 
-    def center_grid(self, dt):
+        # Safe binding for word completion check
+        for cell in self.cells.values():
+            cell.bind(text=self._on_cell_text_change)
+
+    def _on_cell_text_change(self, cell, value):
+        filled = bool(value)
+        delta = filled - cell.is_filled
+        cell.is_filled = filled
+        # only words going through the changed cell can be completed
+        for word_idx in cell.word_ids:
+            self.filled_count[word_idx] += delta
+            if self.filled_count[word_idx] == self.word_lengths[word_idx]:
+                self._dirty_words.add(word_idx)
+        if self._dirty_words and not self._check_scheduled:
+            self._check_scheduled = True
+            Clock.schedule_once(self._flush_checks, 0)
+
+    def _flush_checks(self, dt):
+        self._check_scheduled = False
+        dirty_words, self._dirty_words = self._dirty_words, set()
+        for word_idx in dirty_words:
+            # word may have been emptied again since it was marked
+            if self.filled_count[word_idx] == self.word_lengths[word_idx]:
+                self._check_single_word(word_idx)
+
+    def cell_at(self, row, col):
+        """Cell at (row, col), None when outside grid or no cell there"""
+        if 0 <= row <= self.max_row and 0 <= col <= self.max_col:
+            return self.cells_grid[row][col]
+        return None
+
+    def center_grid(self, *args):
         self.grid_container.pos = (
             (self.width - self.grid_container.width) / 2,
             (self.height - self.grid_container.height) / 2
         )
 
-    def check_word_completion(self):
-        for word_idx, ws in enumerate(self.puzzle.words):
-            if word_idx in self.words_completed:
-                continue
-            row, col = ws.position
-            word = ws.word
-            direction = ws.direction
-            user_word = ''
-            cells_in_word = []
-            for i in range(len(word)):
-                pos = (row, col + i) if direction == 'across' else (row + i, col)
-                cell = self.cells[pos]
-                cells_in_word.append(cell)
-                user_word += cell.text
-            if user_word == word:
-                for cell in cells_in_word:
-                    cell.freeze()
-                self.words_completed.add(word_idx)
-                if self.on_word_complete:
-                    self.on_word_complete(word_idx, True)
-            elif len(user_word) == len(word) and user_word != word and all(c.text for c in cells_in_word):
-                self.show_incorrect_word(cells_in_word)
-                if self.on_word_complete:
-                    self.on_word_complete(word_idx, False)
+    def _check_single_word(self, word_idx):
+        if word_idx in self.words_completed:
+            return
+        cells_in_word = self.word_cells[word_idx]
+        # single pass: bail out on first empty cell (incomplete word, nothing to check yet)
+        match = True
+        for cell, letter in zip(cells_in_word, self.word_chars[word_idx]):
+            text = cell.text
+            if not text:
+                return
+            if text != letter:
+                match = False
+        if match:
+            for cell in cells_in_word:
+                cell.freeze()
+                self._unlink_frozen(cell)
+            self.words_completed.add(word_idx)
+            if self.on_word_complete:
+                self.on_word_complete(word_idx, True)
+        else:
+            self.show_incorrect_word(cells_in_word)
+            if self.on_word_complete:
+                self.on_word_complete(word_idx, False)
+
+    def _unlink_frozen(self, cell):
+        for word_idx in cell.word_ids:
+            prev_cell = self.prev_cells[word_idx].get(cell)
+            next_cell = self.next_cells[word_idx].get(cell)
+            if prev_cell:
+                self.next_cells[word_idx][prev_cell] = next_cell
+            if next_cell:
+                self.prev_cells[word_idx][next_cell] = prev_cell
 
     def show_incorrect_word(self, cells):
         for cell in cells:
             cell.show_incorrect()
-        def reset_cells(dt):
+        self._pending_reset.append((time.monotonic() + 1.0, cells))
+        if not self._reset_scheduled:
+            self._reset_scheduled = True
+            Clock.schedule_once(self._reset_pending, 1.0)
+
+    def _reset_pending(self, dt):
+        now = time.monotonic()
+        pending = self._pending_reset
+        while pending and pending[0][0] <= now:
+            _, cells = pending.popleft()
             for cell in cells:
                 if not cell.is_frozen:
                     cell.text = ''
                     cell.reset_appearance()
-        Clock.schedule_once(reset_cells, 1.0)
+        if pending:
+            # wake up again for the next deadline
+            Clock.schedule_once(self._reset_pending, pending[0][0] - now)
+        else:
+            self._reset_scheduled = False
+
+class ClueView(RecycleDataViewBehavior, BoxLayout):
+    """Recycled view of a clue: bold number next to the clue text, wrapped to width"""
+    number = StringProperty('')
+    clue = StringProperty('')
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.size_hint_y = None
+        self.height = self.clue_height = CLUE_H
+        self.spacing = CELL_SPACING
+        self.number_label = Label(
+            bold=True,
+            font_size=FONT_MEDIUM,
+            color=SUBTLE,
+            size_hint_x=None,
+            width=FONT_MEDIUM * 2,
+            halign='right',
+            valign='top'
+        )
+        self.number_label.bind(size=self.number_label.setter('text_size'))
+        self.clue_label = Label(
+            font_size=FONT_MEDIUM,
+            color=SUBTLE,
+            halign='left',
+            valign='top'
+        )
+        self.clue_label.bind(width=self._on_clue_width, texture_size=self._on_clue_texture_size)
+        self.add_widget(self.number_label)
+        self.add_widget(self.clue_label)
+
+    def on_number(self, instance, number):
+        self.number_label.text = number
+
+    def on_clue(self, instance, clue):
+        self.clue_label.text = clue
+
+    def refresh_view_attrs(self, rv, index, data):
+        super().refresh_view_attrs(rv, index, data)
+        # a reused view gets no texture_size event when new clue wraps to same size, so
+        # height is derived here from the freshly rendered text
+        self.clue_label.texture_update()
+        self.clue_height = self.clue_label.texture_size[1] + PAD2
+
+    def refresh_view_layout(self, rv, index, layout, viewport):
+        super().refresh_view_layout(rv, index, layout, viewport)
+        # layout applies height it has for index (default one when never shown): a different
+        # height set here is pushed back to the layout
+        self.height = self.clue_height
+
+    def _on_clue_width(self, label, width):
+        label.text_size = (width - PAD2, None)
+
+    def _on_clue_texture_size(self, label, texture_size):
+        self.clue_height = self.height = texture_size[1] + PAD2
 
 class CluesList(BoxLayout):
     """Display list of clues for across or down"""
@@ -237,12 +414,12 @@ class CluesList(BoxLayout):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         self.spacing = CELL_SPACING
-        self.padding = CELL_SPACING * 2
+        self.padding = PAD2
         title_label = Label(
-            text=f'[b]{title}[/b]',
-            markup=True,
+            text=title,
+            bold=True,
             size_hint_y=None,
-            height=FONT_LARGE * 1.3,
+            height=TITLE_H,
             font_size=FONT_LARGE,
             color=DARK,
             halign='left',
@@ -250,21 +427,15 @@ class CluesList(BoxLayout):
         )
         title_label.bind(size=title_label.setter('text_size'))
         self.add_widget(title_label)
-        for number, clue_text in sorted(clues):
-            clue_label = Label(
-                text=f'[b]{number}.[/b] {clue_text}',
-                markup=True,
-                size_hint_y=None,
-                height=FONT_LARGE * 1.2,
-                font_size=FONT_MEDIUM,
-                color=SUBTLE,
-                halign='left',
-                valign='top',
-                text_size=(None, None)
-            )
-            clue_label.bind(width=lambda l, w: l.setter('text_size')(l, (w - CELL_SPACING * 2, None)))
-            clue_label.bind(texture_size=lambda l, ts: l.setter('height')(l, ts[1] + CELL_SPACING * 2))
-            self.add_widget(clue_label)
+        # only visible clues get a (reused) label widget
+        clues_view = RecycleView(do_scroll_x=False, do_scroll_y=True)
+        clues_layout = RecycleBoxLayout(orientation='vertical', spacing=CELL_SPACING,
+                                        default_size_hint=(1, None), size_hint_y=None)
+        clues_layout.bind(minimum_height=clues_layout.setter('height'))
+        clues_view.add_widget(clues_layout)
+        clues_view.viewclass = ClueView
+        clues_view.data = [{'number': f'{number}.', 'clue': clue_text} for number, clue_text in sorted(clues)]
+        self.add_widget(clues_view)
 
 class CrosswordApp(App):
     """Main application/controller class"""
@@ -274,16 +445,17 @@ class CrosswordApp(App):
         Window.clearcolor = PANEL
         self.start_time = None
         self.timer_running = True
+        self.shown_elapsed = 0  # seconds currently displayed by timer_label
         self.puzzle_store = PuzzleStore()
         self.current_puzzle = None
         self.current_grid = None
         self.current_no = None
 
         # Main layout - horizontal split
-        self.main_layout = BoxLayout(orientation='horizontal', spacing=CELL_SPACING * 2, padding=CELL_SPACING * 2)
+        self.main_layout = BoxLayout(orientation='horizontal', spacing=PAD2, padding=PAD2)
 
         # Left side - Grid and header
-        self.left_layout = BoxLayout(orientation='vertical', spacing=CELL_SPACING * 2)
+        self.left_layout = BoxLayout(orientation='vertical', spacing=PAD2)
 
         # Header/Menu bar
         self.header = BoxLayout(size_hint_y=None, height=FONT_LARGE * 2.5, spacing=CELL_SPACING)
@@ -314,7 +486,6 @@ class CrosswordApp(App):
         # Title label (will be updated)
         self.title_label = Label(
             text='Press New to create your first Puzzle',
-            markup=True,
             font_size=FONT_LARGE,
             color=DARK,
             size_hint_x=1
@@ -355,40 +526,43 @@ class CrosswordApp(App):
 
         # Right side - Clues
         self.clues_layout = BoxLayout(orientation='vertical', size_hint_x=0.3, spacing=CELL_SPACING)
-        self.across_scroll = ScrollView(do_scroll_x=False, do_scroll_y=True)
-        self.down_scroll = ScrollView(do_scroll_x=False, do_scroll_y=True)
-        self.clues_layout.add_widget(self.across_scroll)
-        self.clues_layout.add_widget(self.down_scroll)
+        # clues scroll within their own RecycleView
+        self.across_panel = BoxLayout()
+        self.down_panel = BoxLayout()
+        self.clues_layout.add_widget(self.across_panel)
+        self.clues_layout.add_widget(self.down_panel)
 
         self.main_layout.add_widget(self.left_layout)
         self.main_layout.add_widget(self.clues_layout)
 
+        self.timer_event = Clock.schedule_interval(self.update_timer, 1)
+
         # Check if store is empty
         if not self.puzzle_store.list_puzzles():
             self.display_empty_state()
         else:
             self.load_latest_puzzle()
 
-        Clock.schedule_interval(self.update_timer, 1)
-        Window.bind(on_key_down=self._on_keyboard_down)
-
         return self.main_layout
 
     def display_empty_state(self):
         self.grid_container.clear_widgets()
-        self.across_scroll.clear_widgets()
-        self.down_scroll.clear_widgets()
+        self.across_panel.clear_widgets()
+        self.down_panel.clear_widgets()
         self.title_label.text = 'Press New to create your first Puzzle'
+        self.title_label.bold = False
         self.delete_btn.disabled = True
         self.pause_btn.disabled = True
+        self.shown_elapsed = 0
         self.timer_label.text = 'Time: 00:00'
 
     def update_header(self):
         # Update title with puzzle number
+        self.title_label.bold = True
         if self.current_no is not None:
-            self.title_label.text = f'[b]Crossword Puzzle no.{self.current_no}[/b]'
+            self.title_label.text = f'Crossword Puzzle no.{self.current_no}'
         else:
-            self.title_label.text = '[b]Crossword Puzzle[/b]'
+            self.title_label.text = 'Crossword Puzzle'
 
     def load_latest_puzzle(self):
         puzzles = self.puzzle_store.list_puzzles()
@@ -396,7 +570,7 @@ class CrosswordApp(App):
             self.display_empty_state()
             return
         no, pid = puzzles[-1]
-        data = self.puzzle_store.store.get(pid)
+        data = self.puzzle_store.get(pid)
         puzzle = PuzzleSpec.from_dict(data)
         self.current_puzzle = puzzle
         self.current_no = no
@@ -445,10 +619,10 @@ class CrosswordApp(App):
                 across_clues.append((ws.number, ws.clue))
             else:
                 down_clues.append((ws.number, ws.clue))
-        self.across_scroll.clear_widgets()
-        self.down_scroll.clear_widgets()
-        self.across_scroll.add_widget(CluesList('ACROSS', across_clues))
-        self.down_scroll.add_widget(CluesList('DOWN', down_clues))
+        self.across_panel.clear_widgets()
+        self.down_panel.clear_widgets()
+        self.across_panel.add_widget(CluesList('ACROSS', across_clues))
+        self.down_panel.add_widget(CluesList('DOWN', down_clues))
         # Update header and buttons
         self.update_header()
         self.delete_btn.disabled = False
@@ -456,10 +630,13 @@ class CrosswordApp(App):
         # Reset timer
         self.start_time = Clock.get_time()
         self.timer_running = True
+        self.timer_event()
+        self.shown_elapsed = 0
         self.timer_label.text = 'Time: 00:00'
         
+        handler = self.handle_cell_key
         for cell in self.current_grid.cells.values():
-            cell.keyboard_on_key_down = self.make_keyboard_handler(cell)
+            cell.key_handler = handler
 
     def on_new_puzzle(self, *args):
         self.load_new_puzzle()
@@ -478,105 +655,70 @@ class CrosswordApp(App):
     def on_pause_timer(self, *args):
         self.timer_running = not self.timer_running
         self.pause_btn.text = "Resume" if not self.timer_running else "Pause"
+        # no ticking while paused
+        if self.timer_running:
+            self.timer_event()
+        else:
+            self.timer_event.cancel()
 
     def update_timer(self, dt):
         if not self.timer_running or self.start_time is None or not self.current_puzzle:
             return
         elapsed = int(Clock.get_time() - self.start_time)
+        # avoid formatting and label texture refresh when unchanged
+        if elapsed == self.shown_elapsed:
+            return
+        self.shown_elapsed = elapsed
         minutes = elapsed // 60
         seconds = elapsed % 60
         self.timer_label.text = f'Time: {minutes:02d}:{seconds:02d}'
 
-    def _on_keyboard_down(self, window, key, scancode, codepoint, modifier):
-        pass
-
-    def make_keyboard_handler(self, cell):
-        def handler(window, keycode, text, modifiers):
-            if cell.is_frozen:
-                return
-            key, key_str = keycode
-            if key_str == 'backspace':
-                if cell.text:
-                    cell.text = ''
-                else:
-                    self.move_to_previous_cell(cell)
-                return True
-            if text and text.isalpha():
-                cell.text = text.upper()
-                self.move_to_next_cell(cell)
-                return True
-            if key_str in ['right', 'left', 'up', 'down']:
-                self.handle_arrow_key(cell, key_str)
-                return True
-        return handler
+    def handle_cell_key(self, cell, keycode, text):
+        if cell.is_frozen:
+            return
+        key, key_str = keycode
+        if key_str == 'backspace':
+            if cell.text:
+                cell.text = ''
+            else:
+                self.move_to_previous_cell(cell)
+            return True
+        if text and text.isalpha():
+            cell.text = text.upper()
+            self.move_to_next_cell(cell)
+            return True
+        if key_str in ARROW_DELTAS:
+            self.handle_arrow_key(cell, key_str)
+            return True
 
     def move_to_next_cell(self, current_cell):
         if current_cell.is_frozen:
             return
-        current_row, current_col = current_cell.row, current_cell.col
         for word_idx in current_cell.word_ids:
-            word_data = self.current_puzzle.words[word_idx]
             if word_idx in self.current_grid.words_completed:
                 continue
-            start_row, start_col = word_data.position
-            direction = word_data.direction
-            word_length = len(word_data.word)
-            if direction == 'across':
-                current_pos_in_word = current_col - start_col
-                for offset in range(current_pos_in_word + 1, word_length):
-                    next_pos = (current_row, start_col + offset)
-                    if next_pos in self.current_grid.cells and not self.current_grid.cells[next_pos].is_frozen:
-                        self.current_grid.cells[next_pos].focus = True
-                        return
-            else:
-                current_pos_in_word = current_row - start_row
-                for offset in range(current_pos_in_word + 1, word_length):
-                    next_pos = (start_row + offset, current_col)
-                    if next_pos in self.current_grid.cells and not self.current_grid.cells[next_pos].is_frozen:
-                        self.current_grid.cells[next_pos].focus = True
-                        return
+            next_cell = self.current_grid.next_cells[word_idx].get(current_cell)
+            if next_cell:
+                next_cell.focus = True
+                return
 
     def move_to_previous_cell(self, current_cell):
-        current_row, current_col = current_cell.row, current_cell.col
         for word_idx in current_cell.word_ids:
-            word_data = self.current_puzzle.words[word_idx]
             if word_idx in self.current_grid.words_completed:
                 continue
-            start_row, start_col = word_data.position
-            direction = word_data.direction
-            if direction == 'across':
-                current_pos_in_word = current_col - start_col
-                if current_pos_in_word > 0:
-                    for offset in range(current_pos_in_word - 1, -1, -1):
-                        prev_pos = (current_row, start_col + offset)
-                        if prev_pos in self.current_grid.cells and not self.current_grid.cells[prev_pos].is_frozen:
-                            self.current_grid.cells[prev_pos].focus = True
-                            self.current_grid.cells[prev_pos].text = ''
-                            return
-            else:
-                current_pos_in_word = current_row - start_row
-                if current_pos_in_word > 0:
-                    for offset in range(current_pos_in_word - 1, -1, -1):
-                        prev_pos = (start_row + offset, current_col)
-                        if prev_pos in self.current_grid.cells and not self.current_grid.cells[prev_pos].is_frozen:
-                            self.current_grid.cells[prev_pos].focus = True
-                            self.current_grid.cells[prev_pos].text = ''
-                            return
+            prev_cell = self.current_grid.prev_cells[word_idx].get(current_cell)
+            if prev_cell:
+                prev_cell.focus = True
+                prev_cell.text = ''
+                return
 
     def handle_arrow_key(self, current_cell, direction):
-        current_row, current_col = current_cell.row, current_cell.col
-        if direction == 'right':
-            next_pos = (current_row, current_col + 1)
-        elif direction == 'left':
-            next_pos = (current_row, current_col - 1)
-        elif direction == 'down':
-            next_pos = (current_row + 1, current_col)
-        elif direction == 'up':
-            next_pos = (current_row - 1, current_col)
-        else:
+        delta = ARROW_DELTAS.get(direction)
+        if delta is None:
             return
-        if next_pos in self.current_grid.cells:
-            self.current_grid.cells[next_pos].focus = True
+        next_cell = self.current_grid.cell_at(current_cell.row + delta[0], current_cell.col + delta[1])
+        if next_cell:
+            next_cell.focus = True
 
     def on_word_complete(self, word_idx, is_correct):
         if is_correct:
@@ -587,10 +729,10 @@ class CrosswordApp(App):
         elapsed = int(Clock.get_time() - self.start_time) if self.start_time else 0
         minutes = elapsed // 60
         seconds = elapsed % 60
-        content = BoxLayout(orientation='vertical', padding=CELL_SPACING * 5, spacing=CELL_SPACING * 3)
+        content = BoxLayout(orientation='vertical', padding=PAD5, spacing=PAD3)
         congrats_label = Label(
-            text='[b]Congratulations![/b]',
-            markup=True,
+            text='Congratulations!',
+            bold=True,
             font_size=FONT_LARGE * 1.3,
             color=GOOD,
             size_hint_y=None,
@@ -1,37 +1,78 @@
-from kivy.storage.dictstore import DictStore
+import json
+import os
+import sqlite3
 from typing import Optional
 from domain import PuzzleSpec
 
 class PuzzleStore:
-    def __init__(self, filename="puzzles.json"):
-        self.store = DictStore(filename)
+    def __init__(self, filename="puzzles.db", legacy_filename="puzzles.json"):
+        # autocommit, each put/delete is a single-row write (no full file rewrite)
+        self.conn = sqlite3.connect(filename, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS puzzles(id TEXT PRIMARY KEY, data TEXT)")
+        # result of list_puzzles, reset whenever puzzles are saved or deleted
+        self._listing: Optional[tuple] = None
+        # puzzles saved by the former DictStore-based store are imported once (flagged by
+        # the db user_version, the legacy file itself is left untouched)
+        imported = self.conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+        if not imported and os.path.exists(legacy_filename):
+            self._import_legacy(legacy_filename)
+
+    def _import_legacy(self, legacy_filename: str):
+        """
+        Copy all puzzles of the legacy DictStore file into the db, and flag the db as imported.
+        """
+        from kivy.storage.dictstore import DictStore
+
+        legacy = DictStore(legacy_filename)
+        # single transaction: nothing is kept (nor flagged) when import fails, so it is retried
+        self.conn.execute("BEGIN")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO puzzles VALUES(?, ?)",
+                ((pid, json.dumps(legacy.get(pid))) for pid in legacy.keys()),
+            )
+            self.conn.execute("PRAGMA user_version = 1")
 
     def save_puzzle(self, puzzle: PuzzleSpec):
         """
         Save a Puzzle instance to the store.
         """
-        self.store.put(puzzle.id, **puzzle.to_dict())
+        self.conn.execute(
+            "INSERT OR REPLACE INTO puzzles VALUES(?, ?)",
+            (puzzle.id, json.dumps(puzzle.to_dict())),
+        )
+        self._listing = None
+
+    def get(self, puzzle_id: str) -> Optional[dict]:
+        """
+        Get the stored data of a puzzle using its id.
+        """
+        row = self.conn.execute("SELECT data FROM puzzles WHERE id = ?", (puzzle_id,)).fetchone()
+        return json.loads(row[0]) if row else None
 
     def load_puzzle(self, puzzle: PuzzleSpec) -> Optional[PuzzleSpec]:
         """
         Load a Puzzle instance from the store using its id.
         """
-        if self.store.exists(puzzle.id):
-            data = self.store.get(puzzle.id)
+        data = self.get(puzzle.id)
+        if data is not None:
             return PuzzleSpec.from_dict(data)
         return None
 
-    def list_puzzles(self) -> list:
+    def list_puzzles(self) -> tuple:
         """
         List all puzzle ids in the store, sorted by id.
-        Returns a list of tuples: (sequential_no, puzzle_id)
+        Returns a tuple (shared, hence immutable) of tuples: (sequential_no, puzzle_id)
         """
-        ids = sorted(self.store.keys())
-        return [(i + 1, pid) for i, pid in enumerate(ids)]
+        if self._listing is None:
+            rows = self.conn.execute("SELECT id FROM puzzles ORDER BY id")
+            self._listing = tuple((i + 1, pid) for i, (pid,) in enumerate(rows))
+        return self._listing
 
     def delete_puzzle(self, puzzle: PuzzleSpec):
         """
         Delete a Puzzle instance from the store using its id.
         """
-        if self.store.exists(puzzle.id):
-            self.store.delete(puzzle.id)
+        self.conn.execute("DELETE FROM puzzles WHERE id = ?", (puzzle.id,))
+        self._listing = None
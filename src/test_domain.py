@@ -82,6 +82,23 @@ def tst_gen_patterns():
     assert set(patterns) == set(expected_patterns)
 
 
+def test_generate_patterns_dedup():
+    # 'ß---K--' is reached by trimming right then left, and left then right: generated once,
+    # in depth-first order (trim "right" before trim "left")
+    patterns = list(domain.generate_patterns('F-ß---K---中--', pos=0, min_size=3))
+    assert patterns == [
+        (r'\[(\d+)\](F\w{1}ß\w{3}K\w{3}中\w{0,2})\[(\d+)\]', 0), # 'F-ß---K---中--'
+        (r'\[(\d+)\](F\w{1}ß\w{3}K\w{0,2})\[(\d+)\]', 0),        # 'F-ß---K--'
+        (r'\[(\d+)\](F\w{1}ß\w{0,2})\[(\d+)\]', 0),              # 'F-ß--'
+        (r'\[(\d+)\](ß\w{0,2})\[(\d+)\]', 2),                    # 'ß--'
+        (r'\[(\d+)\](ß\w{3}K\w{0,2})\[(\d+)\]', 2),              # 'ß---K--'
+        (r'\[(\d+)\](\w{0,2}K\w{0,2})\[(\d+)\]', 4),             # '--K--'
+        (r'\[(\d+)\](ß\w{3}K\w{3}中\w{0,2})\[(\d+)\]', 2),       # 'ß---K---中--'
+        (r'\[(\d+)\](\w{0,2}K\w{3}中\w{0,2})\[(\d+)\]', 4),      # '--K---中--'
+        (r'\[(\d+)\](\w{0,2}中\w{0,2})\[(\d+)\]', 8),            # '--中--'
+    ]
+
+
 def tst_word():
     word = domain.Word(word='Test')
     assert word.canonical == 'TEST'
@@ -108,6 +125,80 @@ def tst_word():
 
 
 
+def test_find_matches():
+    puzzle = domain.Puzzle(grid_size=9, words=[('Word', ''), ('Bada', ''), ('Ecolos', ''), ('Sm', '')])
+    assert puzzle.available_wordseq == '[0]ECOLOS[1]WORD[2]BADA[3]SM'
+    assert puzzle.index_of('Bada') == 2
+
+    assert puzzle.find_matches('---O-----') == (0, 'ECOLOS')
+    assert puzzle.find_matches('--D------') == (2, 'BADA')
+    assert puzzle.find_matches('-C---') is None
+    assert puzzle.find_matches('Z--') is None
+    # last word in sequence, and word not allowed to touch a letter outside it
+    assert puzzle.find_matches('-M-') == (3, 'SM')
+    assert puzzle.find_matches('ECOLOSX--') is None
+    # placed word no longer available
+    puzzle.place_word(0, domain.Location(direction=0, index=0), pos=0)
+    assert puzzle.find_matches('---O-----') == (1, 'WORD')
+
+    assert puzzle._is_location_blocked([('----', 0), ('--', 5)])
+    assert not puzzle._is_location_blocked([('----', 0), ('-A', 5)])
+
+
+def placed_puzzle_steps():
+    """Yield puzzle after each placement of a few crossing words (as in test_puzzle)"""
+    puzzle = domain.Puzzle(grid_size=9, words=[('Word', ''), ('Bada', ''), ('Ecolos', ''), ('Sorsdela', ''), ('Sm', '')])
+    yield puzzle
+    for w, loc, pos in [('Word', domain.Location(direction=1, index=3), 2),
+                        ('Bada', domain.Location(direction=0, index=5), 1),
+                        ('Ecolos', domain.Location(direction=0, index=3), 1),
+                        ('Sorsdela', domain.Location(direction=1, index=6), 0)]:
+        puzzle.place_word(puzzle.index_of(w), loc, pos)
+        yield puzzle
+
+
+def test_cached_lines():
+    for puzzle in placed_puzzle_steps():
+        # all lines read from cache, cached before this placement or not
+        cached = {loc: puzzle._entire_textpattern(loc) for loc in puzzle.all_locations}
+        puzzle._cached_lines.clear()
+        for loc, line in cached.items():
+            assert line == puzzle._entire_textpattern(loc), loc
+
+
+def test_available_locations():
+    for puzzle in placed_puzzle_steps():
+        assert len(puzzle.available_locations) == len(set(puzzle.available_locations))
+        assert set(puzzle.available_locations) == puzzle.all_locations - puzzle.complete_locations - puzzle.empty_locations
+        assert len(puzzle._available_index) == len(puzzle.available_locations)
+        for loc, i in puzzle._available_index.items():
+            assert puzzle.available_locations[i] == loc
+
+
+def test_fillout_timeout():
+    words = [('Word', ''), ('Wtesber', ''), ('Sorsdela', ''), ('Bada', ''), ('Ecolos',''), ('MotsdesFa',''),
+             ('small', ''), ('Datavault',''), ('Short',''), ('Sm','')]
+    puzzle = domain.Puzzle(grid_size=9, words=words)
+
+    assert puzzle.fillout(timeout=0) == domain.StopCondition.TIMEOUT
+    # only first word placed, and structures agree with it
+    assert puzzle.nb_placed_words == 1
+    [word] = [w for ws in puzzle.placed_words.values() for w in ws]
+    assert puzzle.letter_at_cell == word.cells
+    assert {(r, c): l for r, row in enumerate(puzzle.grid) for c, l in enumerate(row) if l != '-'} == word.cells
+    assert bin(puzzle.available_bits).count('1') == len(puzzle.available_words) - 1
+    assert set(puzzle.available_locations) == puzzle.all_locations - puzzle.complete_locations - puzzle.empty_locations
+
+
+def test_to_dict():
+    puzzle = domain.Puzzle(grid_size=9, words=[('Word', 'a clue'), ('Sm', '')])
+    puzzle.place_word(0, domain.Location(direction=1, index=3), pos=2)
+
+    data = puzzle.to_dict()
+    assert data['id'] == puzzle.id
+    assert data['grid_size'] == 9
+    assert data['words'] == [{'word': 'Word', 'canonical': 'WORD', 'clue': 'a clue', 'row': 2, 'col': 3, 'direction': 1}]
+
 
 def test_puzzle():
     def ppuzzle(title, puzzle):
@@ -123,8 +214,7 @@ def test_puzzle():
     puzzle = domain.Puzzle(grid_size=9, words=a_words)
                                                           
     def word_idx(w):
-        the_w = domain.Word(word=w)
-        return puzzle.available_words.index(the_w)
+        return puzzle.index_of(w)
 
     assert puzzle.min_size_word == 2
     assert puzzle.available_wordseq == '[0]MOTSDESFA[1]DATAVAULT[2]SORSDELA[3]WTESBER[4]ECOLOS[5]SMALL[6]SHORT[7]WORD[8]BADA[9]SM'
@@ -146,6 +236,7 @@ def test_puzzle():
 
     ppuzzle(title, puzzle)
     assert puzzle.placed_words[loc][0] == word
+    assert puzzle.letter_at_cell == {(2,3): 'W', (3,3): 'O', (4,3): 'R', (5,3): 'D'}
     assert puzzle.empty_locations ==  { domain.Location(d,i) for d in (0,1) for i in range(9) if (d == 1 or (d == 0 and i not in word.span()))}
     assert puzzle.available_wordseq == '[0]MOTSDESFA[1]DATAVAULT[2]SORSDELA[3]WTESBER[4]ECOLOS[5]SMALL[6]SHORT[8]BADA[9]SM'
 